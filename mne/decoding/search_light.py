@@ -6,10 +6,10 @@ import numpy as np
 
 from .mixin import TransformerMixin
 from .base import BaseEstimator, _check_estimator
-from ..fixes import _get_check_scoring
+from ..fixes import _get_check_scoring, has_numba, jit, prange
 from ..parallel import parallel_func
-from ..utils import (_validate_type, array_split_idx, ProgressBar,
-                     verbose, fill_doc)
+from ..utils import (_validate_type, _check_option, array_split_idx,
+                     ProgressBar, verbose, fill_doc)
 
 
 @fill_doc
@@ -34,24 +34,45 @@ class SlidingEstimator(BaseEstimator, TransformerMixin):
     %(n_jobs)s
         The number of jobs to run in parallel for both `fit` and `predict`.
         If -1, then the number of jobs is set to the number of cores.
+        The data splits are memory-mapped to the workers instead of being
+        pickled if :func:`mne.set_cache_dir` and
+        :func:`mne.set_memmap_min_size` are set.
+    dtype : dtype | None
+        The dtype the data are cast to before fitting, predicting and
+        scoring, e.g. ``np.float32`` to halve the memory traffic. If None
+        (default), the dtype of the data is used.
+
+        .. versionadded:: 0.21
+    prefer : str | None
+        If ``'threads'``, run the jobs in threads instead of processes, which
+        avoids copying the data and estimators to the workers. This is
+        faster for estimators that release the GIL while fitting and
+        predicting, e.g. ``LogisticRegression(solver='liblinear')`` or
+        ``LinearSVC``. If None (default) or ``'processes'``, use processes.
+        See :class:`joblib.Parallel`.
+
+        .. versionadded:: 0.21
     %(verbose)s
 
     Attributes
     ----------
-    estimators_ : array-like, shape (n_tasks,)
+    estimators_ : list, shape (n_tasks,)
         List of fitted scikit-learn estimators (one per task).
     """
 
-    def __init__(self, base_estimator, scoring=None, n_jobs=1,
-                 verbose=None):  # noqa: D102
+    def __init__(self, base_estimator, scoring=None, n_jobs=1, dtype=None,
+                 prefer=None, verbose=None):  # noqa: D102
         _check_estimator(base_estimator)
         self._estimator_type = getattr(base_estimator, "_estimator_type", None)
         self.base_estimator = base_estimator
         self.n_jobs = n_jobs
         self.scoring = scoring
+        self.dtype = dtype
+        self.prefer = prefer
         self.verbose = verbose
 
         _validate_type(self.n_jobs, 'int', 'n_jobs')
+        _check_option('prefer', self.prefer, (None, 'threads', 'processes'))
 
     def __repr__(self):  # noqa: D105
         repr_str = '<' + super(SlidingEstimator, self).__repr__()
@@ -84,26 +105,28 @@ class SlidingEstimator(BaseEstimator, TransformerMixin):
         self._check_Xy(X, y)
         self.estimators_ = list()
         self.fit_params = fit_params
+        n_tasks = X.shape[-1]
+        X = _tasks_first(X, self.dtype)
         # For fitting, the parallelization is across estimators.
-        parallel, p_func, n_jobs = parallel_func(_sl_fit, self.n_jobs,
-                                                 verbose=False)
-        n_jobs = min(n_jobs, X.shape[-1])
+        parallel, p_func, n_jobs = parallel_func(
+            _sl_fit, self.n_jobs, pre_dispatch='2*n_jobs', prefer=self.prefer,
+            verbose=False)
+        # Fitting time can vary a lot across tasks (e.g. convergence), so use
+        # more splits than jobs to let joblib balance the load.
+        n_splits = n_jobs if n_jobs == 1 else 4 * n_jobs
+        n_splits = min(n_splits, n_tasks)
         mesg = 'Fitting %s' % (self.__class__.__name__,)
-        with ProgressBar(X.shape[-1], mesg=mesg) as pb:
+        with ProgressBar(n_tasks, mesg=mesg) as pb:
             estimators = parallel(
                 p_func(self.base_estimator, split, y, pb.subset(pb_idx),
                        **fit_params)
-                for pb_idx, split in array_split_idx(X, n_jobs, axis=-1))
+                for pb_idx, split in array_split_idx(X, n_splits))
 
         # Each parallel job can have a different number of training estimators
-        # We can't directly concatenate them because of sklearn's Bagging API
-        # (see scikit-learn #9720)
-        self.estimators_ = np.empty(X.shape[-1], dtype=object)
-        idx = 0
-        for job_estimators in estimators:
-            for est in job_estimators:
-                self.estimators_[idx] = est
-                idx += 1
+        # We can't use numpy to concatenate them because of sklearn's Bagging
+        # API (see scikit-learn #9720)
+        self.estimators_ = [est for job_estimators in estimators
+                            for est in job_estimators]
         return self
 
     def fit_transform(self, X, y, **fit_params):
@@ -136,20 +159,27 @@ class SlidingEstimator(BaseEstimator, TransformerMixin):
         if X.shape[-1] != len(self.estimators_):
             raise ValueError('The number of estimators does not match '
                              'X.shape[-1]')
+        n_tasks = X.shape[-1]
+        X = _tasks_first(X, self.dtype)
+        if method in ('predict', 'decision_function'):
+            y_pred = _sl_linear_transform(self.estimators_, X, method)
+            if y_pred is not None:
+                return y_pred
         # For predictions/transforms the parallelization is across the data and
         # not across the estimators to avoid memory load.
         mesg = 'Transforming %s' % (self.__class__.__name__,)
         parallel, p_func, n_jobs = parallel_func(
-            _sl_transform, self.n_jobs, verbose=False)
-        n_jobs = min(n_jobs, X.shape[-1])
-        X_splits = np.array_split(X, n_jobs, axis=-1)
-        idx, est_splits = zip(*array_split_idx(self.estimators_, n_jobs))
-        with ProgressBar(X.shape[-1], mesg=mesg) as pb:
+            _sl_transform, self.n_jobs, prefer=self.prefer, verbose=False)
+        n_jobs = min(n_jobs, n_tasks)
+        X_splits = np.array_split(X, n_jobs)
+        idx = np.array_split(np.arange(n_tasks), n_jobs)
+        est_splits = _split_estimators(self.estimators_, idx)
+        with ProgressBar(n_tasks, mesg=mesg) as pb:
             y_pred = parallel(p_func(est, x, method, pb.subset(pb_idx))
                               for pb_idx, est, x in zip(
                                   idx, est_splits, X_splits))
 
-        y_pred = np.concatenate(y_pred, axis=1)
+        y_pred = _concatenate_splits(y_pred, axis=1)
         return y_pred
 
     def transform(self, X):
@@ -281,17 +311,21 @@ class SlidingEstimator(BaseEstimator, TransformerMixin):
 
         scoring = check_scoring(self.base_estimator, self.scoring)
         y = _fix_auc(scoring, y)
+        n_tasks = X.shape[-1]
+        X = _tasks_first(X, self.dtype)
 
         # For predictions/transforms the parallelization is across the data and
         # not across the estimators to avoid memory load.
-        parallel, p_func, n_jobs = parallel_func(_sl_score, self.n_jobs)
-        n_jobs = min(n_jobs, X.shape[-1])
-        X_splits = np.array_split(X, n_jobs, axis=-1)
-        est_splits = np.array_split(self.estimators_, n_jobs)
+        parallel, p_func, n_jobs = parallel_func(_sl_score, self.n_jobs,
+                                                 prefer=self.prefer)
+        n_jobs = min(n_jobs, n_tasks)
+        X_splits = np.array_split(X, n_jobs)
+        est_splits = _split_estimators(
+            self.estimators_, np.array_split(np.arange(n_tasks), n_jobs))
         score = parallel(p_func(est, scoring, x, y)
                          for (est, x) in zip(est_splits, X_splits))
 
-        score = np.concatenate(score, axis=0)
+        score = _concatenate_splits(score, axis=0)
         return score
 
     @property
@@ -312,9 +346,10 @@ def _sl_fit(estimator, X, y, pb, **fit_params):
     ----------
     base_estimator : object
         The base estimator to iteratively fit on a subset of the dataset.
-    X : array, shape (n_samples, nd_features, n_estimators)
-        The target data. The feature dimension can be multidimensional e.g.
-        X.shape = (n_samples, n_features_1, n_features_2, n_estimators)
+    X : array, shape (n_estimators, n_samples, nd_features)
+        The target data, with the tasks along the first axis so that each
+        slice is contiguous. The feature dimension can be multidimensional
+        e.g. X.shape = (n_estimators, n_samples, n_features_1, n_features_2)
     y : array, shape (n_sample, )
         The target values.
     fit_params : dict | None
@@ -327,9 +362,9 @@ def _sl_fit(estimator, X, y, pb, **fit_params):
     """
     from sklearn.base import clone
     estimators_ = list()
-    for ii in range(X.shape[-1]):
+    for ii, X_task in enumerate(X):
         est = clone(estimator)
-        est.fit(X[..., ii], y, **fit_params)
+        est.fit(X_task, y, **fit_params)
         estimators_.append(est)
         pb.update(ii + 1)
     return estimators_
@@ -344,9 +379,10 @@ def _sl_transform(estimators, X, method, pb):
     ----------
     estimators : list of estimators
         The fitted estimators.
-    X : array, shape (n_samples, nd_features, n_estimators)
-        The target data. The feature dimension can be multidimensional e.g.
-        X.shape = (n_samples, n_features_1, n_features_2, n_estimators)
+    X : array, shape (n_estimators, n_samples, nd_features)
+        The target data, with the tasks along the first axis. The feature
+        dimension can be multidimensional e.g.
+        X.shape = (n_estimators, n_samples, n_features_1, n_features_2)
     method : str
         The estimator method to use (e.g. 'predict', 'transform').
 
@@ -355,9 +391,9 @@ def _sl_transform(estimators, X, method, pb):
     y_pred : array, shape (n_samples, n_estimators, n_classes * (n_classes-1) // 2)
         The transformations for each slice of data.
     """  # noqa: E501
-    for ii, est in enumerate(estimators):
-        transform = getattr(est, method)
-        _y_pred = transform(X[..., ii])
+    transforms = [getattr(est, method) for est in estimators]
+    for ii, transform in enumerate(transforms):
+        _y_pred = transform(X[ii])
         # Initialize array of predictions on the first transform iteration
         if ii == 0:
             y_pred = _sl_init_pred(_y_pred, X)
@@ -368,7 +404,7 @@ def _sl_transform(estimators, X, method, pb):
 
 def _sl_init_pred(y_pred, X):
     """Aux. function to SlidingEstimator to initialize y_pred."""
-    n_sample, n_tasks = X.shape[0], X.shape[-1]
+    n_tasks, n_sample = X.shape[:2]
     y_pred = np.zeros((n_sample, n_tasks) + y_pred.shape[1:], y_pred.dtype)
     return y_pred
 
@@ -382,9 +418,10 @@ def _sl_score(estimators, scoring, X, y):
     ----------
     estimators : list, shape (n_tasks,)
         The fitted estimators.
-    X : array, shape (n_samples, nd_features, n_tasks)
-        The target data. The feature dimension can be multidimensional e.g.
-        X.shape = (n_samples, n_features_1, n_features_2, n_tasks)
+    X : array, shape (n_tasks, n_samples, nd_features)
+        The target data, with the tasks along the first axis. The feature
+        dimension can be multidimensional e.g.
+        X.shape = (n_tasks, n_samples, n_features_1, n_features_2)
     scoring : callable, str or None
         If scoring is None (default), the predictions are internally
         generated by estimator.score(). Else, we must first get the
@@ -397,13 +434,109 @@ def _sl_score(estimators, scoring, X, y):
     score : array, shape (n_tasks,)
         The score for each task / slice of data.
     """
-    n_tasks = X.shape[-1]
-    score = np.zeros(n_tasks)
+    n_tasks = X.shape[0]
     for ii, est in enumerate(estimators):
-        score[ii] = scoring(est, X[..., ii], y)
+        _score = scoring(est, X[ii], y)
+        # Initialize array of scores on the first score iteration
+        if ii == 0:
+            score = np.zeros(n_tasks, type(_score))
+        score[ii] = _score
     return score
 
 
+def _sl_linear_transform(estimators, X, method):
+    """Apply linear estimators to all tasks with a single batched matmul.
+
+    X is (n_tasks, n_samples, n_features). Returns None if the estimators
+    are not plain linear models or if X is not finite, in which case they
+    are applied one by one (and sklearn validates the data).
+    """
+    from sklearn.linear_model import (LinearRegression, LogisticRegression,
+                                      Ridge, RidgeClassifier)
+    from sklearn.svm import LinearSVC
+    if method == 'predict':
+        # RidgeClassifier.predict differs for multilabel problems
+        classifiers = (LogisticRegression, LinearSVC)
+        regressors = (LinearRegression, Ridge)
+    else:
+        classifiers = (LogisticRegression, LinearSVC, RidgeClassifier)
+        regressors = ()
+    if X.ndim != 3:
+        return None
+    params = _get_linear_params(estimators, classifiers + regressors,
+                                X.shape[-1])
+    if params is None or not np.isfinite(X).all():
+        return None
+    coef, intercept = params
+    y_pred = np.matmul(X, coef.transpose(0, 2, 1)) + intercept[:, np.newaxis]
+    y_pred = np.ascontiguousarray(y_pred.transpose(1, 0, 2))
+    if isinstance(estimators[0], regressors):
+        if estimators[0].coef_.ndim == 1:
+            y_pred = y_pred[..., 0]
+        return y_pred
+    if coef.shape[1] == 1:
+        y_pred = y_pred[..., 0]
+    if method == 'predict':
+        classes = estimators[0].classes_
+        if not all(np.array_equal(est.classes_, classes)
+                   for est in estimators):
+            return None
+        if y_pred.ndim == 2:
+            indices = (y_pred > 0).astype(int)
+        else:
+            indices = y_pred.argmax(axis=-1)
+        y_pred = classes.take(indices)
+    return y_pred
+
+
+def _get_linear_params(estimators, types, n_features):
+    """Stack the coefficients and intercepts of linear estimators.
+
+    Returns None unless all estimators are of the same type among ``types``
+    (exact types only, so that a subclass cannot change how they predict)
+    with dense ``coef_`` of the same shape.
+    """
+    est_type = type(estimators[0])
+    if est_type not in types:
+        return None
+    shape = estimators[0].coef_.shape
+    for est in estimators:
+        if (type(est) is not est_type or
+                not isinstance(est.coef_, np.ndarray) or
+                est.coef_.shape != shape):
+            return None
+    if shape[-1] != n_features:
+        return None  # let sklearn raise
+    coef = np.array([np.atleast_2d(est.coef_) for est in estimators])
+    intercept = np.array([np.zeros(coef.shape[1], coef.dtype) + est.intercept_
+                          for est in estimators])
+    return coef, intercept
+
+
+def _tasks_first(X, dtype=None):
+    """Move the task dimension first and make each task slice contiguous.
+
+    ``X[..., ii]`` is strided, which makes most estimators copy the data
+    on each call; ``X[ii]`` on the returned array is C-contiguous.
+    """
+    return np.ascontiguousarray(np.moveaxis(X, -1, 0), dtype=dtype)
+
+
+def _split_estimators(estimators, idx):
+    """Split the estimators along the task index splits."""
+    return [estimators[ii[0]:ii[-1] + 1] for ii in idx]
+
+
+def _concatenate_splits(splits, axis):
+    """Gather the outputs of the parallel jobs along axis.
+
+    With a single job the output is returned as is rather than copied.
+    """
+    if len(splits) == 1:
+        return splits[0]
+    return np.concatenate(splits, axis=axis)
+
+
 def _check_method(estimator, method):
     """Check that an estimator has the method attribute.
 
@@ -438,6 +571,24 @@ class GeneralizingEstimator(SlidingEstimator):
     %(n_jobs)s
         The number of jobs to run in parallel for both `fit` and `predict`.
         If -1, then the number of jobs is set to the number of cores.
+        The data splits are memory-mapped to the workers instead of being
+        pickled if :func:`mne.set_cache_dir` and
+        :func:`mne.set_memmap_min_size` are set.
+    dtype : dtype | None
+        The dtype the data are cast to before fitting, predicting and
+        scoring, e.g. ``np.float32`` to halve the memory traffic. If None
+        (default), the dtype of the data is used.
+
+        .. versionadded:: 0.21
+    prefer : str | None
+        If ``'threads'``, run the jobs in threads instead of processes, which
+        avoids copying the data and estimators to the workers. This is
+        faster for estimators that release the GIL while fitting and
+        predicting, e.g. ``LogisticRegression(solver='liblinear')`` or
+        ``LinearSVC``. If None (default) or ``'processes'``, use processes.
+        See :class:`joblib.Parallel`.
+
+        .. versionadded:: 0.21
     %(verbose)s
     """
 
@@ -453,17 +604,21 @@ class GeneralizingEstimator(SlidingEstimator):
         """Aux. function to make parallel predictions/transformation."""
         self._check_Xy(X)
         method = _check_method(self.base_estimator, method)
+        n_iter = X.shape[-1]
+        # put the slices second once, so that the workers can stack the data
+        # of all slices without copying it
+        X = np.ascontiguousarray(np.moveaxis(X, -1, 1), dtype=self.dtype)
         mesg = 'Transforming %s' % (self.__class__.__name__,)
         parallel, p_func, n_jobs = parallel_func(
-            _gl_transform, self.n_jobs, verbose=False)
-        n_jobs = min(n_jobs, X.shape[-1])
-        with ProgressBar(X.shape[-1] * len(self.estimators_), mesg=mesg) as pb:
+            _gl_transform, self.n_jobs, prefer=self.prefer, verbose=False)
+        n_jobs = min(n_jobs, n_iter)
+        with ProgressBar(n_iter * len(self.estimators_), mesg=mesg) as pb:
             y_pred = parallel(
                 p_func(self.estimators_, x_split, method, pb.subset(pb_idx))
                 for pb_idx, x_split in array_split_idx(
-                    X, n_jobs, axis=-1, n_per_split=len(self.estimators_)))
+                    X, n_jobs, axis=1, n_per_split=len(self.estimators_)))
 
-        y_pred = np.concatenate(y_pred, axis=2)
+        y_pred = _concatenate_splits(y_pred, axis=2)
         return y_pred
 
     def transform(self, X):
@@ -569,14 +724,20 @@ class GeneralizingEstimator(SlidingEstimator):
         """  # noqa: E501
         check_scoring = _get_check_scoring()
         self._check_Xy(X)
+        X = np.asarray(X, dtype=self.dtype)
         # For predictions/transforms the parallelization is across the data and
         # not across the estimators to avoid memory load.
         mesg = 'Scoring %s' % (self.__class__.__name__,)
         parallel, p_func, n_jobs = parallel_func(_gl_score, self.n_jobs,
+                                                 prefer=self.prefer,
                                                  verbose=False)
         n_jobs = min(n_jobs, X.shape[-1])
         scoring = check_scoring(self.base_estimator, self.scoring)
         y = _fix_auc(scoring, y)
+        if self.scoring is None:
+            score = _gl_linear_score(self.estimators_, X, y, n_jobs)
+            if score is not None:
+                return score
         with ProgressBar(X.shape[-1] * len(self.estimators_), mesg=mesg) as pb:
             score = parallel(p_func(self.estimators_, scoring, x, y,
                                     pb.subset(pb_idx))
@@ -584,7 +745,7 @@ class GeneralizingEstimator(SlidingEstimator):
                                  X, n_jobs, axis=-1,
                                  n_per_split=len(self.estimators_)))
 
-        score = np.concatenate(score, axis=1)
+        score = _concatenate_splits(score, axis=1)
         return score
 
 
@@ -595,29 +756,25 @@ def _gl_transform(estimators, X, method, pb):
 
     Parameters
     ----------
-    X : array, shape (n_samples, nd_features, n_slices)
-        The training input samples. For each data slice, a clone estimator
-        is fitted independently. The feature dimension can be multidimensional
-        e.g. X.shape = (n_samples, n_features_1, n_features_2, n_estimators)
+    X : array, shape (n_samples, n_slices, nd_features)
+        The input samples, with the slices along the second axis. The feature
+        dimension can be multidimensional e.g.
+        X.shape = (n_samples, n_slices, n_features_1, n_features_2)
 
     Returns
     -------
     Xt : array, shape (n_samples, n_slices)
         The transformed values generated by each estimator.
     """
-    n_sample, n_iter = X.shape[0], X.shape[-1]
-    for ii, est in enumerate(estimators):
-        # stack generalized data for faster prediction
-        X_stack = X.transpose(np.r_[0, X.ndim - 1, range(1, X.ndim - 1)])
-        X_stack = X_stack.reshape(np.r_[n_sample * n_iter, X_stack.shape[2:]])
-        transform = getattr(est, method)
+    n_sample, n_iter = X.shape[:2]
+    # stack generalized data for faster prediction, once for all estimators;
+    # this is a view if X is C-contiguous
+    X_stack = X.reshape((n_sample * n_iter,) + X.shape[2:])
+    transforms = [getattr(est, method) for est in estimators]
+    for ii, transform in enumerate(transforms):
         _y_pred = transform(X_stack)
         # unstack generalizations
-        if _y_pred.ndim == 2:
-            _y_pred = np.reshape(_y_pred, [n_sample, n_iter, _y_pred.shape[1]])
-        else:
-            shape = np.r_[n_sample, n_iter, _y_pred.shape[1:]].astype(int)
-            _y_pred = np.reshape(_y_pred, shape)
+        _y_pred = _y_pred.reshape((n_sample, n_iter) + _y_pred.shape[1:])
         # Initialize array of predictions on the first transform iteration
         if ii == 0:
             y_pred = _gl_init_pred(_y_pred, X, len(estimators))
@@ -628,12 +785,9 @@ def _gl_transform(estimators, X, method, pb):
 
 def _gl_init_pred(y_pred, X, n_train):
     """Aux. function to GeneralizingEstimator to initialize y_pred."""
-    n_sample, n_iter = X.shape[0], X.shape[-1]
-    if y_pred.ndim == 3:
-        y_pred = np.zeros((n_sample, n_train, n_iter, y_pred.shape[-1]),
-                          y_pred.dtype)
-    else:
-        y_pred = np.zeros((n_sample, n_train, n_iter), y_pred.dtype)
+    n_sample, n_iter = X.shape[:2]
+    y_pred = np.zeros((n_sample, n_train, n_iter) + y_pred.shape[2:],
+                      y_pred.dtype)
     return y_pred
 
 
@@ -665,8 +819,10 @@ def _gl_score(estimators, scoring, X, y, pb):
     # consuming. Perhaps need to lower it down to the loop across X slices.
     score_shape = [len(estimators), X.shape[-1]]
     for jj in range(X.shape[-1]):
+        # copy the slice once so that all estimators read contiguous data
+        X_jj = np.ascontiguousarray(X[..., jj])
         for ii, est in enumerate(estimators):
-            _score = scoring(est, X[..., jj], y)
+            _score = scoring(est, X_jj, y)
             # Initialize array of predictions on the first score iteration
             if (ii == 0) and (jj == 0):
                 dtype = type(_score)
@@ -676,6 +832,72 @@ def _gl_score(estimators, scoring, X, y, pb):
     return score
 
 
+def _gl_linear_score(estimators, X, y, n_jobs):
+    """Compute the accuracy of linear classifiers on all slices at once.
+
+    Returns None if the fast path does not apply, i.e. if numba is not
+    available, if the estimators are not plain linear classifiers or if X
+    is not finite (so that sklearn raises).
+    """
+    from sklearn.linear_model import LogisticRegression, RidgeClassifier
+    from sklearn.svm import LinearSVC
+    if not has_numba or X.ndim != 3 or np.ndim(y) != 1:
+        return None
+    import numba
+    if not hasattr(numba, 'set_num_threads'):  # numba < 0.49
+        return None
+    params = _get_linear_params(
+        estimators, (LogisticRegression, RidgeClassifier, LinearSVC),
+        X.shape[1])
+    if params is None:
+        return None
+    classes = estimators[0].classes_
+    if not all(np.array_equal(est.classes_, classes) for est in estimators):
+        return None
+    coef = np.ascontiguousarray(params[0].transpose(0, 2, 1), np.float64)
+    intercept = params[1].astype(np.float64)
+    # labels that are not in classes_ can never be predicted correctly
+    y_idx = np.searchsorted(classes, y)
+    y_idx = np.minimum(y_idx, len(classes) - 1)
+    y_idx = np.where(classes[y_idx] == y, y_idx, -1)
+    X = np.ascontiguousarray(np.moveaxis(X, -1, 0), dtype=np.float64)
+    if not np.isfinite(X).all():
+        return None
+    # use as many threads as jobs
+    old_n_threads = numba.get_num_threads()
+    numba.set_num_threads(min(n_jobs, numba.config.NUMBA_NUM_THREADS))
+    try:
+        return _gl_linear_accuracy(X, coef, intercept, y_idx)
+    finally:
+        numba.set_num_threads(old_n_threads)
+
+
+@jit(parallel=True)
+def _gl_linear_accuracy(X, coef, intercept, y_idx):
+    """Accuracy of each (estimator, slice) pair, as in ``est.score``.
+
+    X is (n_slices, n_samples, n_features), coef is
+    (n_estimators, n_features, n_outputs) and intercept is
+    (n_estimators, n_outputs).
+    """
+    n_est, n_out = coef.shape[0], coef.shape[2]
+    n_iter, n_sample = X.shape[0], X.shape[1]
+    score = np.zeros((n_est, n_iter))
+    for ii in prange(n_est):
+        for jj in range(n_iter):
+            decision = np.dot(X[jj], coef[ii]) + intercept[ii]
+            n_correct = 0
+            for kk in range(n_sample):
+                if n_out == 1:
+                    pred = 1 if decision[kk, 0] > 0 else 0
+                else:
+                    pred = np.argmax(decision[kk])
+                if pred == y_idx[kk]:
+                    n_correct += 1
+            score[ii, jj] = n_correct / n_sample
+    return score
+
+
 def _fix_auc(scoring, y):
     from sklearn.preprocessing import LabelEncoder
     # This fixes sklearn's inability to compute roc_auc when y not in [0, 1]
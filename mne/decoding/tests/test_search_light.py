@@ -3,11 +3,11 @@
 # License: BSD (3-clause)
 
 import numpy as np
-from numpy.testing import assert_array_equal, assert_equal
+from numpy.testing import assert_array_equal, assert_equal, assert_allclose
 import pytest
 
 from mne.utils import requires_sklearn
-from mne.fixes import _get_args
+from mne.fixes import _get_args, has_numba
 from mne.decoding.search_light import SlidingEstimator, GeneralizingEstimator
 from mne.decoding.transformer import Vectorizer
 
@@ -114,6 +114,11 @@ def test_search_light():
     assert_array_equal(score_sl.shape, [n_time])
     assert (score_sl.dtype == float)
 
+    # The scores keep the dtype returned by the scorer
+    sl2 = SlidingEstimator(
+        logreg, scoring=lambda est, X, y: np.float32(est.score(X, y)))
+    assert (sl2.fit(X, y).score(X, y).dtype == np.float32)
+
     # Check that scoring was applied adequately
     scoring = make_scorer(roc_auc_score, needs_threshold=True)
     score_manual = [scoring(est, x, y) for est, x in zip(
@@ -171,6 +176,74 @@ def test_search_light():
         assert (isinstance(pipe.estimators_[0], BaggingClassifier))
 
 
+@requires_sklearn
+def test_search_light_linear_transform():
+    """Test SlidingEstimator predictions of linear models."""
+    from sklearn.linear_model import (LinearRegression, LogisticRegression,
+                                      Ridge, RidgeClassifier)
+    from sklearn.svm import LinearSVC
+
+    X, y = make_data()
+    y3 = np.arange(len(X)) % 3 + 1
+    y_reg = np.random.RandomState(0).randn(len(X), 2)
+    for est, y_, X_ in ((LogisticRegression(solver='liblinear'), y, X),
+                        (LinearSVC(dual=False), y3, X),
+                        (RidgeClassifier(), y3, X),
+                        (LinearRegression(), y_reg[:, 0], X),
+                        (LinearRegression(), y_reg, X),
+                        (Ridge(), y_reg[:, :1], X.astype(np.float32))):
+        sl = SlidingEstimator(est).fit(X_, y_)
+        for method in ('predict', 'decision_function'):
+            if not hasattr(est, method):
+                continue
+            y_pred = getattr(sl, method)(X_)
+            manual = np.array([getattr(e, method)(X_[..., ii])
+                               for ii, e in enumerate(sl.estimators_)])
+            manual = np.moveaxis(manual, 0, 1)
+            assert y_pred.dtype == manual.dtype
+            assert y_pred.shape == manual.shape
+            assert_allclose(y_pred, manual, rtol=1e-5, atol=1e-5)
+    # non-finite data raise as in sklearn
+    sl = SlidingEstimator(LogisticRegression(solver='liblinear')).fit(X, y)
+    X[0, 0, 0] = np.nan
+    for method in ('predict', 'decision_function'):
+        pytest.raises(ValueError, getattr(sl, method), X)
+
+
+@requires_sklearn
+def test_search_light_dtype():
+    """Test casting the data of SlidingEstimator and GeneralizingEstimator."""
+    from sklearn.linear_model import Ridge
+    from sklearn.base import clone
+
+    X, y = make_data()
+    y = y.astype(float)
+    for klass in (SlidingEstimator, GeneralizingEstimator):
+        est = klass(Ridge(), dtype=np.float32)
+        assert clone(est).dtype == np.float32
+        est.fit(X, y)
+        assert est.estimators_[0].coef_.dtype == np.float32
+        assert est.predict(X).dtype == np.float32
+        y_pred = klass(Ridge()).fit(X, y).predict(X)
+        assert y_pred.dtype == np.float64
+        assert_allclose(est.predict(X), y_pred, rtol=1e-4, atol=1e-4)
+
+
+@requires_sklearn
+def test_search_light_prefer():
+    """Test running SlidingEstimator and GeneralizingEstimator in threads."""
+    from sklearn.svm import SVC
+
+    X, y = make_data()
+    for klass in (SlidingEstimator, GeneralizingEstimator):
+        pytest.raises(ValueError, klass, SVC(), prefer='foo')
+        est = klass(SVC(), n_jobs=2, prefer='threads').fit(X, y)
+        est_1 = klass(SVC()).fit(X, y)
+        assert_array_equal(est.decision_function(X),
+                           est_1.decision_function(X))
+        assert_array_equal(est.score(X, y), est_1.score(X, y))
+
+
 @requires_sklearn
 def test_generalization_light():
     """Test GeneralizingEstimator."""
@@ -258,6 +331,40 @@ def test_generalization_light():
     assert_array_equal(y_preds[0], y_preds[1])
 
 
+@requires_sklearn
+def test_generalization_light_linear_score():
+    """Test GeneralizingEstimator default scoring of linear classifiers."""
+    from sklearn.linear_model import LogisticRegression, RidgeClassifier
+    from sklearn.svm import LinearSVC
+    if has_numba:
+        import numba
+
+    X, y = make_data()
+    for y_ in (y, np.arange(len(X)) % 3 + 1):
+        for est in (LogisticRegression(solver='liblinear'),
+                    RidgeClassifier(), LinearSVC(dual=False), RidgeClassifier(
+                        fit_intercept=False)):
+            gl = GeneralizingEstimator(est).fit(X, y_)
+            score = gl.score(X[..., :4], y_)
+            manual_score = [[e.score(X[..., jj], y_) for jj in range(4)]
+                            for e in gl.estimators_]
+            assert score.dtype == float
+            assert_allclose(score, manual_score)
+    # unseen labels count as errors
+    y_ = np.arange(len(X)) % 3 + 1
+    gl = GeneralizingEstimator(RidgeClassifier()).fit(X, y_)
+    n_threads = numba.get_num_threads() if has_numba else None
+    score = gl.score(X, y_ + 1)
+    if has_numba:  # n_jobs only limits the threads during scoring
+        assert numba.get_num_threads() == n_threads
+    manual_score = [[e.score(X[..., jj], y_ + 1) for jj in range(X.shape[-1])]
+                    for e in gl.estimators_]
+    assert_allclose(score, manual_score)
+    # non-finite data raise as in sklearn
+    X[0, 0, 0] = np.nan
+    pytest.raises(ValueError, gl.score, X, y_)
+
+
 @requires_sklearn
 def test_cross_val_predict():
     """Test cross_val_predict with predict_proba."""